@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Make the repository root importable once, so every test module can import
+# the mecsimcalc package directly instead of path-hacking individual
+# submodules (which loaded a second copy of each module per path layout).
+PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PARENT_DIR not in sys.path:
+    sys.path.insert(1, PARENT_DIR)
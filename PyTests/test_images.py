@@ -1,18 +1,18 @@
-import sys
 import os
 import base64
 import mimetypes
 from PIL import Image
 import io
 
-# caution: path[0] is reserved for script path (or '' in REPL)
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
-PARENT_DIR = os.path.dirname(THIS_DIR)
 
-sys.path.insert(1, f"{PARENT_DIR}/mecsimcalc/file_utils")
-
-from general_utils import input_to_file, metadata_to_filetype
-from image_utils import input_to_PIL, file_to_PIL, print_image
+from mecsimcalc import (
+    input_to_file,
+    metadata_to_filetype,
+    input_to_PIL,
+    file_to_PIL,
+    print_image,
+)
 
 # tests decode_file_data
 
@@ -1,16 +1,7 @@
-import sys
-import os
-
 import matplotlib.pyplot as plt
 import numpy as np
 
-# caution: path[0] is reserved for script path (or '' in REPL)
-THIS_DIR = os.path.dirname(os.path.abspath(__file__))
-PARENT_DIR = os.path.dirname(THIS_DIR)
-
-sys.path.insert(1, f"{PARENT_DIR}/mecsimcalc")
-
-from plot_draw import *
+from mecsimcalc.plot_draw import *
 
 
 def test_all_functions():
@@ -1,4 +1,3 @@
-import sys
 import os
 
 import matplotlib.pyplot as plt
@@ -6,13 +5,9 @@ import numpy as np
 
 from matplotlib.animation import FuncAnimation
 
-# caution: path[0] is reserved for script path (or '' in REPL)
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
-PARENT_DIR = os.path.dirname(THIS_DIR)
 
-sys.path.insert(1, f"{PARENT_DIR}/mecsimcalc/file_utils")
-
-from plotting_utils import print_plot, print_animation, animate_plot, plot_slider
+from mecsimcalc import print_plot, print_animation, animate_plot, plot_slider
 
 
 def test_print_plot():
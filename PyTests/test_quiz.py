@@ -1,15 +1,8 @@
-import sys
-import os
 import unittest
 from unittest.mock import patch, MagicMock
 
-# caution: path[0] is reserved for script path (or '' in REPL)
-THIS_DIR = os.path.dirname(os.path.abspath(__file__))
-PARENT_DIR = os.path.dirname(THIS_DIR)
-
-sys.path.insert(1, f"{PARENT_DIR}/mecsimcalc/file_utils")
-
-from quiz_utils import append_to_google_sheet, send_gmail
+from mecsimcalc.file_utils import quiz_utils
+from mecsimcalc import append_to_google_sheet, send_gmail
 
 
 class TestAppendToGoogleSheet(unittest.TestCase):
@@ -47,6 +40,10 @@ class TestAppendToGoogleSheet(unittest.TestCase):
 
 
 class TestSendEmail(unittest.TestCase):
+    def setUp(self):
+        # empty the connection pool so tests don't reuse each other's mocks
+        quiz_utils._SMTP_POOL.clear()
+
     @patch("mecsimcalc.file_utils.quiz_utils.smtplib.SMTP_SSL")
     def test_send_email_success(self, mock_smtp_ssl):
         # Setup test data
@@ -57,8 +54,7 @@ class TestSendEmail(unittest.TestCase):
         values = [("Data1", "Data2"), ("Data3", "Data4")]
 
         # Configure the mock SMTP server
-        mock_server = MagicMock()
-        mock_smtp_ssl.return_value.__enter__.return_value = mock_server
+        mock_server = mock_smtp_ssl.return_value
 
         # Execute the function
         res = send_gmail(sender_email, receiver_email, subject, app_password, values)
@@ -86,8 +82,8 @@ class TestSendEmail(unittest.TestCase):
         app_password = "app-specific-password"
         values = [("Data1", "Data2"), ("Data3", "Data4")]
 
-        # Configure the mock SMTP server to raise an exception
-        mock_smtp_ssl.return_value.__enter__.side_effect = Exception("SMTP Error")
+        # Configure the mock SMTP server to raise an exception on connect
+        mock_smtp_ssl.side_effect = Exception("SMTP Error")
 
         # Execute the function
         res = send_gmail(sender_email, receiver_email, subject, app_password, values)
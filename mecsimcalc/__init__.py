@@ -1,33 +1,29 @@
 # included in __all__: import using "from mecsimcalc import *" or "import mecsimcalc"
+#
+# Submodules are loaded lazily (PEP 562): each name is imported the first time
+# it is accessed, so using e.g. input_to_file alone doesn't pay the
+# matplotlib/pandas/openpyxl/requests import cost.
+import importlib
 
-from .file_utils.general_utils import input_to_file, metadata_to_filetype
-
-from .file_utils.image_utils import input_to_PIL, file_to_PIL, print_image
-
-
-from .file_utils.plotting_utils import (
-    print_plot,
-    print_animation,
-    animate_plot,
-    plot_slider,
-)
-
-
-from .file_utils.spreadsheet_utils import (
-    input_to_dataframe,
-    file_to_dataframe,
-    print_dataframe,
-)
-
-from .file_utils.table_utils import table_to_dataframe, print_table
-
-from .file_utils.text_utils import string_to_file
-
-from .file_utils.quiz_utils import append_to_google_sheet, send_gmail
-
-# not included in __all__: import using "from mecsimcalc.plot_draw import *" or "import mecsimcalc.plot_draw"
-from .plot_draw import *
-
+_LAZY = {
+    "input_to_file": "mecsimcalc.file_utils.general_utils",
+    "metadata_to_filetype": "mecsimcalc.file_utils.general_utils",
+    "input_to_PIL": "mecsimcalc.file_utils.image_utils",
+    "file_to_PIL": "mecsimcalc.file_utils.image_utils",
+    "print_image": "mecsimcalc.file_utils.image_utils",
+    "print_plot": "mecsimcalc.file_utils.plotting_utils",
+    "print_animation": "mecsimcalc.file_utils.plotting_utils",
+    "animate_plot": "mecsimcalc.file_utils.plotting_utils",
+    "plot_slider": "mecsimcalc.file_utils.plotting_utils",
+    "input_to_dataframe": "mecsimcalc.file_utils.spreadsheet_utils",
+    "file_to_dataframe": "mecsimcalc.file_utils.spreadsheet_utils",
+    "print_dataframe": "mecsimcalc.file_utils.spreadsheet_utils",
+    "table_to_dataframe": "mecsimcalc.file_utils.table_utils",
+    "print_table": "mecsimcalc.file_utils.table_utils",
+    "string_to_file": "mecsimcalc.file_utils.text_utils",
+    "append_to_google_sheet": "mecsimcalc.file_utils.quiz_utils",
+    "send_gmail": "mecsimcalc.file_utils.quiz_utils",
+}
 
 __all__ = [
     "input_to_dataframe",
@@ -48,3 +44,30 @@ __all__ = [
     "animate_plot",
     "plot_slider",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name])
+        value = getattr(module, name)
+        globals()[name] = value  # cache so __getattr__ only runs once per name
+        return value
+
+    if name == "plot_draw":
+        module = importlib.import_module(".plot_draw", __name__)
+        globals()[name] = module
+        return module
+
+    # not included in __all__: the plot_draw names were previously pulled in
+    # with "from .plot_draw import *"; resolve them the same way, lazily
+    plot_draw = importlib.import_module(".plot_draw", __name__)
+    if name in plot_draw.__all__:
+        value = getattr(plot_draw, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | {"plot_draw"})
@@ -1,16 +1,46 @@
 import io
-import os
-import base64
 from typing import Union, Tuple, Callable
 
 import matplotlib.pyplot as plt
 import matplotlib.figure as figure
-from matplotlib.animation import FuncAnimation
+from matplotlib.animation import FuncAnimation, PillowWriter
 
 import numpy as np
 import plotly.graph_objects as go
 import plotly.io as pio
 
+from mecsimcalc.file_utils.general_utils import _b64_parallel, _get_buf, _put_buf
+
+# data-URI prefixes, built once instead of per call
+_JPEG_PFX = "data:image/jpeg;base64,"
+_GIF_PFX = "data:image/gif;base64,"
+
+
+class _InMemoryPillowWriter(PillowWriter):
+    """
+    PillowWriter that can render a gif into an in-memory buffer.
+
+    The stock writer validates that ``outfile`` is a filesystem path and lets
+    Pillow infer the format from its suffix; this variant skips the path check
+    and saves explicitly as a gif so an ``io.BytesIO`` can be the target.
+    """
+
+    def setup(self, fig, outfile, dpi=None):
+        self.outfile = outfile
+        self.fig = fig
+        self.dpi = fig.dpi if dpi is None else dpi
+        self._frames = []
+
+    def finish(self):
+        self._frames[0].save(
+            self.outfile,
+            format="gif",
+            save_all=True,
+            append_images=self._frames[1:],
+            duration=int(1000 / self.fps),
+            loop=0,
+        )
+
 
 def print_plot(
     plot_obj: Union[plt.Axes, figure.Figure],
@@ -19,6 +49,7 @@ def print_plot(
     download: bool = False,
     download_text: str = "Download Plot",
     download_file_name: str = "myplot",
+    fast: bool = True,
 ) -> Union[str, Tuple[str, str]]:
     """
     >>> print_plot(
@@ -27,7 +58,8 @@ def print_plot(
         dpi: int = 100,
         download: bool = False,
         download_text: str = "Download Plot",
-        download_file_name: str = "myplot"
+        download_file_name: str = "myplot",
+        fast: bool = True
     ) -> Union[str, Tuple[str, str]]
 
     Converts a matplotlib plot into an HTML image tag and optionally provides a download link for the image.
@@ -46,6 +78,10 @@ def print_plot(
         The text to be displayed for the download link. Defaults to `"Download Plot"`.
     download_file_name : str, optional
         The name of the downloaded file. Defaults to `"myplot"`
+    fast : bool, optional
+        If set to True, the image is encoded with Pillow's default settings for
+        the fastest encode. Set to False to spend extra encode time on a
+        smaller image. Defaults to `True`.
 
     Returns
     -------
@@ -78,27 +114,41 @@ def print_plot(
     if isinstance(plot_obj, plt.Axes):
         plot_obj = plot_obj.get_figure()
 
-    # Save the plot to a buffer
-    buffer = io.BytesIO()
-    plot_obj.savefig(buffer, format=file_type, dpi=dpi)
-
-    if hasattr(plot_obj, "close"):
-        plot_obj.close()
-
-    # generate image
-    encoded_image = (
-        f"data:image/{file_type};base64,{base64.b64encode(buffer.getvalue()).decode()}"
-    )
-    html_img = f"<img src='{encoded_image}' width='{width}'>"
+    # Save the plot to a pooled buffer
+    buffer = _get_buf()
+    try:
+        # optimize=True buys ~25% smaller jpegs at the cost of a slower
+        # encode, so the display path defaults to the fast encode
+        pil_kwargs = {} if fast else {"optimize": True}
+        plot_obj.savefig(buffer, format=file_type, dpi=dpi, pil_kwargs=pil_kwargs)
+
+        # Release the figure: Figure has no close() method (so the old
+        # hasattr check never fired), and figures left in pyplot's global
+        # registry accumulate for the lifetime of the process
+        if isinstance(plot_obj, figure.Figure):
+            plt.close(plot_obj)
+        else:
+            # plot_obj is the pyplot module itself; close its current figure
+            plt.close()
+
+        # generate image (encode straight from the buffer's memoryview to avoid
+        # the extra copy made by getvalue())
+        payload = _b64_parallel(buffer.getbuffer())
+        encoded_image = _JPEG_PFX + payload
+        html_img = "".join(
+            ("<img src='", encoded_image, "' width='", str(width), "'>")
+        )
 
-    if not download:
-        return html_img
+        if not download:
+            return html_img
 
-    download_link = (
-        f"<a href='{encoded_image}' "
-        f"download='{download_file_name}.{file_type}'>{download_text}</a>"
-    )
-    return html_img, download_link
+        download_link = (
+            f"<a href='{encoded_image}' "
+            f"download='{download_file_name}.{file_type}'>{download_text}</a>"
+        )
+        return html_img, download_link
+    finally:
+        _put_buf(buffer)
 
 
 def print_animation(
@@ -116,7 +166,8 @@ def print_animation(
     fps : int, optional
         Frames per second for the animation. Defaults to `30`.
     save_dir : str, optional
-        The directory to save the animation. Defaults to `"/tmp/temp_animation.gif"`. (Note: The file will be deleted after the execution of the app is finished.)
+        Unused; kept for backward compatibility. The animation is rendered
+        entirely in memory and no file is written to disk.
 
     Returns
     -------
@@ -137,23 +188,16 @@ def print_animation(
         "animation": animation
     }
     """
-    # Save the animation to a temporary file
-    temp_file = save_dir
-    if not temp_file.endswith(".gif"):
-        temp_file += "temp_animation.gif"
-
-    ani.save(temp_file, writer="pillow", fps=fps)
-
-    # Read the file back into a bytes buffer
-    with open(temp_file, "rb") as f:
-        gif_bytes = f.read()
-
-    # Remove the temporary file (but will get deleted when the execution of the app is finished anyway bc it is in the /tmp folder)
-    os.remove(temp_file)
+    # Render the gif straight into a pooled buffer (no /tmp round-trip)
+    buf = _get_buf()
+    try:
+        ani.save(buf, writer=_InMemoryPillowWriter(fps=fps))
 
-    # Convert the bytes buffer to a base64 string and return it as an image tag
-    gif_base64 = base64.b64encode(gif_bytes).decode("utf-8")
-    return f"<img src='data:image/gif;base64,{gif_base64}' />"
+        # Convert the buffer to a base64 string and return it as an image tag
+        gif_base64 = _b64_parallel(buf.getbuffer())
+    finally:
+        _put_buf(buf)
+    return "".join(("<img src='", _GIF_PFX, gif_base64, "' />"))
 
 
 def animate_plot(
@@ -204,7 +248,8 @@ def animate_plot(
     hold_last_frame : float, optional
         The duration to hold the last frame in seconds. Defaults to `1.0`.
     save_dir : str, optional
-        The directory to save the animation. Defaults to `"/tmp/temp_animation.gif"`. (Note: The file will be deleted after the execution of the app is finished.)
+        Unused; kept for backward compatibility. The animation is rendered
+        entirely in memory and no file is written to disk.
 
     Returns
     -------
@@ -1,4 +1,5 @@
 import requests
+from requests.adapters import HTTPAdapter
 import jwt
 import time
 from datetime import datetime
@@ -6,6 +7,89 @@ import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 import logging
+from typing import Dict, Tuple
+
+# Shared session with keep-alive, so repeated calls (e.g. quiz grading in a
+# loop) reuse one TLS connection instead of handshaking per request
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Access tokens cached per service-account email until shortly before expiry
+_TOKEN_CACHE: Dict[str, Tuple[str, float]] = {}
+
+# Open SMTP connections cached per (sender, password) alongside the time they
+# were last used; the TLS handshake + AUTH cost ~300 ms per message otherwise
+_SMTP_POOL: Dict[Tuple[str, str], Tuple[smtplib.SMTP_SSL, float]] = {}
+_SMTP_TTL = 60  # seconds an idle connection is trusted before reconnecting
+
+
+def _get_smtp_connection(sender_email: str, app_password: str) -> smtplib.SMTP_SSL:
+    """Returns a cached, logged-in SMTP connection for the sender, opening a
+    fresh one when the cached connection is stale or no longer responds."""
+    key = (sender_email, app_password)
+
+    entry = _SMTP_POOL.pop(key, None)
+    if entry is not None:
+        conn, last_used = entry
+        if time.time() - last_used < _SMTP_TTL:
+            try:
+                conn.noop()  # verify liveness before reusing
+                return conn
+            except Exception:
+                pass
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    conn = smtplib.SMTP_SSL("smtp.gmail.com", 465)
+    conn.login(sender_email, app_password)
+    return conn
+
+
+def _get_access_token(service_account_info: dict):
+    """Returns a cached Google OAuth access token, refreshing it when it is
+    within a minute of expiring. Returns None on failure."""
+    try:
+        email = service_account_info["client_email"]
+
+        token, token_exp = _TOKEN_CACHE.get(email, (None, 0.0))
+        if token and time.time() < token_exp - 60:
+            return token
+
+        iat = time.time()
+        exp = iat + 3600  # Token valid for 1 hour
+        # JWT payload
+        payload = {
+            "iss": email,
+            "scope": "https://www.googleapis.com/auth/spreadsheets",
+            "aud": "https://oauth2.googleapis.com/token",
+            "iat": iat,
+            "exp": exp,
+        }
+        # Generate JWT
+        additional_headers = {"kid": service_account_info["private_key_id"]}
+        signed_jwt = jwt.encode(
+            payload,
+            service_account_info["private_key"],
+            algorithm="RS256",
+            headers=additional_headers,
+        )
+        # Exchange JWT for access token
+        params = {
+            "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
+            "assertion": signed_jwt,
+        }
+        response = _SESSION.post("https://oauth2.googleapis.com/token", data=params)
+        response.raise_for_status()  # Raises HTTPError, if one occurred
+        response_data = response.json()
+
+        token = response_data["access_token"]
+        _TOKEN_CACHE[email] = (token, exp)
+        return token
+    except Exception as e:
+        print(f"Error getting access token: {e}")
+        return None
 
 
 def append_to_google_sheet(
@@ -35,6 +119,9 @@ def append_to_google_sheet(
         The unique identifier for the Google Sheets document to which data will be appended.
     values : list of list
         The data to be appended, organized as a list of rows, with each row being a list of values.
+        When appending many submissions, concatenate them into a single `values` list where
+        possible - the Sheets API accepts thousands of rows per append, and one batched call
+        costs a single round-trip.
     range_name : str, optional
         The A1 notation of the starting cell where appending will begin. Defaults to `"Sheet1!A1"`.
     include_timestamp : bool, optional
@@ -75,41 +162,7 @@ def append_to_google_sheet(
     }
     """
 
-    # Helper function to get an access token
-    def _get_access_token(service_account_info: dict):
-        try:
-            iat = time.time()
-            exp = iat + 3600  # Token valid for 1 hour
-            # JWT payload
-            payload = {
-                "iss": service_account_info["client_email"],
-                "scope": "https://www.googleapis.com/auth/spreadsheets",
-                "aud": "https://oauth2.googleapis.com/token",
-                "iat": iat,
-                "exp": exp,
-            }
-            # Generate JWT
-            additional_headers = {"kid": service_account_info["private_key_id"]}
-            signed_jwt = jwt.encode(
-                payload,
-                service_account_info["private_key"],
-                algorithm="RS256",
-                headers=additional_headers,
-            )
-            # Exchange JWT for access token
-            params = {
-                "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
-                "assertion": signed_jwt,
-            }
-            response = requests.post("https://oauth2.googleapis.com/token", data=params)
-            response.raise_for_status()  # Raises HTTPError, if one occurred
-            response_data = response.json()
-            return response_data["access_token"]
-        except Exception as e:
-            print(f"Error getting access token: {e}")
-            return None
-
-    # Get an access token
+    # Get an access token (cached across calls until it nears expiry)
     access_token = _get_access_token(service_account_info)
     if not access_token:
         return {"error": "Failed to get access token"}
@@ -125,7 +178,7 @@ def append_to_google_sheet(
             "Content-Type": "application/json",
         }
         body = {"values": values}
-        response = requests.post(url, headers=headers, json=body)
+        response = _SESSION.post(url, headers=headers, json=body)
         response.raise_for_status()  # Raises HTTPError, if one occurred
         return response.json()
     except Exception as e:
@@ -196,10 +249,10 @@ def send_gmail(
     message.attach(MIMEText(body, "plain"))
 
     try:
-        # Send the email
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-            server.login(sender_email, app_password)
-            server.sendmail(sender_email, receiver_email, message.as_string())
+        # Send the email over a pooled connection, then park it for reuse
+        server = _get_smtp_connection(sender_email, app_password)
+        server.sendmail(sender_email, receiver_email, message.as_string())
+        _SMTP_POOL[(sender_email, app_password)] = (server, time.time())
         logging.info("Email sent successfully!")
         return True
     except Exception as e:
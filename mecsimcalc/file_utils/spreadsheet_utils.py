@@ -1,9 +1,24 @@
 import io
-import base64
 import pandas as pd
 from typing import Union, Tuple
 
 from mecsimcalc import input_to_file, metadata_to_filetype
+from mecsimcalc.file_utils.general_utils import _b64_parallel, _get_buf, _put_buf
+
+# data-URI prefixes, built once instead of per call
+_CSV_PFX = "data:text/csv;base64,"
+_XLSX_PFX = (
+    "data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,"
+)
+
+# pyarrow's multithreaded CSV reader is several times faster than pandas'
+# C engine and releases the GIL; used when available
+try:
+    import pyarrow  # noqa: F401
+
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
 
 
 def file_to_dataframe(file: io.BytesIO) -> pd.DataFrame:
@@ -39,9 +54,19 @@ def file_to_dataframe(file: io.BytesIO) -> pd.DataFrame:
     """
 
     # get dataframe from file data (try csv first, then excel)
+    if _HAS_PYARROW:
+        try:
+            return pd.read_csv(file, engine="pyarrow")
+        except Exception:
+            # pyarrow is stricter than the C engine; rewind and retry below
+            file.seek(0)
+
     try:
         df = pd.read_csv(file)
     except Exception:
+        # rewind: the failed csv attempt leaves the cursor mid-file, which
+        # would make read_excel see a truncated stream
+        file.seek(0)
         try:
             df = pd.read_excel(file, engine="openpyxl")
         except Exception as e:
@@ -50,6 +75,26 @@ def file_to_dataframe(file: io.BytesIO) -> pd.DataFrame:
     return df
 
 
+def _file_to_dataframe(file: io.BytesIO, file_type: str) -> pd.DataFrame:
+    """Parses ``file`` with the reader matching the already-known ``file_type``,
+    skipping ``file_to_dataframe``'s try-csv-then-excel guessing. Unknown or
+    mislabeled types fall back to format sniffing."""
+    try:
+        if file_type == "csv":
+            if _HAS_PYARROW:
+                try:
+                    return pd.read_csv(file, engine="pyarrow")
+                except Exception:
+                    file.seek(0)
+            return pd.read_csv(file)
+        if file_type == "xlsx":
+            return pd.read_excel(file, engine="openpyxl")
+    except Exception:
+        file.seek(0)
+
+    return file_to_dataframe(file)
+
+
 def input_to_dataframe(
     input_file: str, get_file_type: bool = False
 ) -> Union[pd.DataFrame, Tuple[pd.DataFrame, str]]:
@@ -83,13 +128,13 @@ def input_to_dataframe(
     0  1  2  3
     1  4  5  6
     """
-    # converts input file into a dataframe
+    # converts input file into a dataframe, dispatching on the file type the
+    # metadata already tells us instead of guessing the format
     file_data, metadata = input_to_file(input_file, metadata=True)
+    file_type = metadata_to_filetype(metadata)
+    df = _file_to_dataframe(file_data, file_type)
 
-    if get_file_type:
-        return file_to_dataframe(file_data), metadata_to_filetype(metadata)
-    else:
-        return file_to_dataframe(file_data)
+    return (df, file_type) if get_file_type else df
 
 
 def print_dataframe(
@@ -148,39 +193,41 @@ def print_dataframe(
         "download_link": download_link
     }
     """
+    # Serialize the table once; both return paths use it
+    table = df.to_html()
+
     if not download:
-        return df.to_html()
+        return table
 
     # -------- Creating Downloadable File --------#
 
-    buf = io.BytesIO()
+    buf = _get_buf()
     download_file_type = download_file_type.lower()
 
-    # excel
-    if download_file_type in {
-        "excel",
-        "xlsx",
-        "xls",
-        "xlsm",
-        "xlsb",
-        "odf",
-        "ods",
-        "odt",
-        "vnd.openxmlformats-officedocument.spreadsheetml.sheet",  # MIME type
-    }:
-        df.to_excel(buf, index=False, engine="openpyxl")
-        encoded_file = (
-            "data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,"
-            + base64.b64encode(buf.getvalue()).decode()
-        )
-    # csv
-    else:
-        csv_str = df.to_csv(index=False)
-        buf.write(csv_str.encode())
-
-        encoded_file = (
-            "data:text/csv;base64," + base64.b64encode(buf.getvalue()).decode()
-        )
+    try:
+        # excel
+        if download_file_type in {
+            "excel",
+            "xlsx",
+            "xls",
+            "xlsm",
+            "xlsb",
+            "odf",
+            "ods",
+            "odt",
+            "vnd.openxmlformats-officedocument.spreadsheetml.sheet",  # MIME type
+        }:
+            df.to_excel(buf, index=False, engine="openpyxl")
+            encoded_file = _XLSX_PFX + _b64_parallel(buf.getbuffer())
+        # csv
+        else:
+            # pandas writes encoded bytes straight into the binary buffer, so
+            # the table is never materialized as one big Python string
+            df.to_csv(buf, index=False, encoding="utf-8")
+
+            encoded_file = _CSV_PFX + _b64_parallel(buf.getbuffer())
+    finally:
+        _put_buf(buf)
 
     download_link = f"<a href='{encoded_file}' download='{download_file_name}.{download_file_type}'>{download_text}</a>"
-    return df.to_html(), download_link
+    return table, download_link
@@ -1,4 +1,12 @@
-import base64
+# pybase64 provides SIMD-accelerated encode/decode and falls back to the
+# stdlib implementation when it is not installed
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# data-URI prefix, built once instead of per call
+_TXT_PFX = "data:text/plain;base64,"
 
 
 def string_to_file(
@@ -56,8 +64,7 @@ def string_to_file(
         filename = filename[:-4]
 
     # Encode to a text file
-    encoded_text = base64.b64encode(text.encode()).decode()
-    mime_type = "data:text/plain;base64,"
-    encoded_file = mime_type + encoded_text
+    encoded_text = base64.b64encode(text.encode()).decode("ascii")
+    encoded_file = _TXT_PFX + encoded_text
 
     return f"<a href='{encoded_file}' download='{filename}.txt'>{download_text}</a>"